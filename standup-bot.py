@@ -1,52 +1,114 @@
 import os
 import asyncio
 import discord
+from discord import app_commands
 from discord.ext import commands, tasks
 import logging
+import logging.handlers
+import queue
+import atexit
 from dotenv import load_dotenv
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-import pytz
+from apscheduler.jobstores.base import JobLookupError
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import datetime
 import json
 import sys
+import time
+import re
+import random
+import string
+import tempfile
+from dataclasses import dataclass
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library json module
+    orjson = None
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('bot.log')
-    ]
-)
 logger = logging.getLogger('StandupBot')
 
-# Load environment variables
-load_dotenv()
-TOKEN = os.getenv('DISCORD_TOKEN')
-STANDUP_CHANNEL_ID = int(os.getenv('STANDUP_CHANNEL_ID'))
-GUILD_ID = int(os.getenv('GUILD_ID'))
+def setup_logging():
+    """Send log records through a queue to a listener thread, so disk writes never block the event loop"""
+    log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(log_formatter)
+    file_handler = logging.handlers.RotatingFileHandler('bot.log', maxBytes=10 * 1024 * 1024, backupCount=5)
+    file_handler.setFormatter(log_formatter)
+    
+    log_queue = queue.Queue()
+    log_listener = logging.handlers.QueueListener(log_queue, stream_handler, file_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Final formatting happens in the listener's handlers
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+
+# Environment settings, read by build_bot
+TOKEN = None
+STANDUP_CHANNEL_ID = None
+GUILD_ID = None
 
-# Bot configuration with all intents
-intents = discord.Intents.default()
-intents.message_content = True
-intents.members = True
-intents.reactions = True
-bot = commands.Bot(command_prefix="/", intents=intents)
+bot = None  # Created by build_bot
 
 # Global variables for configuration
 CONFIG_FILE = 'db/config.json'
 USER_FILE = 'db/users.json'
+RECAP_CACHE_FILE = 'db/recap_cache.json'
+RESPONSES_FILE = 'db/responses.json'
 
-# Ensure our directories exist
-os.makedirs('db', exist_ok=True)
+def format_date(d):
+    """Format a date as MM/DD/YYYY, the format used in all standup messages"""
+    return f"{d.month:02d}/{d.day:02d}/{d.year}"
+
+# Parsed JSON files, keyed by path -> ((mtime_ns, size), data)
+_json_cache = {}
+
+def file_fingerprint(path):
+    """Return the (mtime_ns, size) pair used to tell whether a file changed"""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+def read_json_file(path):
+    """Read and parse a JSON file, reusing the last parse if the file hasn't changed"""
+    fingerprint = file_fingerprint(path)
+    cached = _json_cache.get(path)
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+    
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson else json.loads(raw)
+    _json_cache[path] = (fingerprint, data)
+    return data
+
+def write_json_file(path, data):
+    """Write JSON to a temp file and rename it into place so a crash never leaves a partial file"""
+    if orjson:
+        raw = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    else:
+        raw = json.dumps(data, separators=(',', ':'), sort_keys=True).encode()
+    
+    # Each write gets its own temp file, so overlapping writes to one path can't clobber each other
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=f"{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    _json_cache[path] = (file_fingerprint(path), data)
 
 # Load or create configuration
 def load_config():
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
+        # Copy so edits to the live config don't touch the cached parse
+        return dict(read_json_file(CONFIG_FILE))
     except FileNotFoundError:
         # Default configuration
         config = {
@@ -56,99 +118,357 @@ def load_config():
             'weekdays_only': True,
             'standup_format': "**Yesterday:**\n- \n\n**Today:**\n- \n\n**Blockers:**\n- "
         }
-        save_config(config)
+        write_json_file(CONFIG_FILE, dict(config))
         return config
 
-def save_config(config):
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
+@dataclass
+class Schedule:
+    """Reminder and deadline times parsed from the config"""
+    reminder_hour: int
+    reminder_minute: int
+    deadline_hour: int
+    deadline_minute: int
+    tz: datetime.tzinfo
+
+def parse_schedule(config):
+    """Parse the configured times and timezone once, so bad values fail at load time"""
+    reminder_hour, reminder_minute = map(int, config['reminder_time'].split(':'))
+    deadline_hour, deadline_minute = map(int, config['deadline_time'].split(':'))
+    return Schedule(reminder_hour, reminder_minute, deadline_hour, deadline_minute, ZoneInfo(config['timezone']))
+
+async def save_config(config):
+    global _saved_config
+    # Copy first so later edits can't race the writer thread, and skip the write if nothing changed
+    snapshot = dict(config)
+    if snapshot == _saved_config:
+        return
+    
+    await asyncio.to_thread(write_json_file, CONFIG_FILE, snapshot)
+    _saved_config = snapshot
 
 # Load or create user list
 def load_users():
     try:
-        with open(USER_FILE, 'r') as f:
-            return json.load(f)
+        # IDs are stored as ints; older files stored them as strings
+        return set(int(user_id) for user_id in read_json_file(USER_FILE))
     except FileNotFoundError:
         # Empty user list
-        users = []
-        save_users(users)
+        users = set()
+        write_json_file(USER_FILE, sorted(users))
         return users
 
-def save_users(users):
-    with open(USER_FILE, 'w') as f:
-        json.dump(users, f, indent=4)
+async def save_users(users):
+    global _saved_users
+    # Skip the write if the list on disk already matches
+    snapshot = sorted(users)
+    if snapshot == _saved_users:
+        return
+    
+    await asyncio.to_thread(write_json_file, USER_FILE, snapshot)
+    _saved_users = snapshot
+
+# Load the recap cache, dropping it if the file is missing or unreadable
+def load_recap_cache():
+    try:
+        # Copy so pruning and updates don't touch the cached parse
+        return dict(read_json_file(RECAP_CACHE_FILE))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+async def save_recap_cache():
+    """Write the recap cache if it changed, logging failures instead of raising"""
+    global _recap_cache_dirty, _recap_cache_lock
+    if _recap_cache_lock is None:
+        _recap_cache_lock = asyncio.Lock()
+    
+    # One write at a time; changes made meanwhile are picked up by the next save
+    async with _recap_cache_lock:
+        if not _recap_cache_dirty:
+            return
+        
+        # Only keep the days a weekly recap can still ask for
+        cutoff = time.time() - RECAP_CACHE_MAX_AGE
+        for key in [key for key, entry in _recap_cache.items() if entry['day_start'] < cutoff]:
+            del _recap_cache[key]
+        
+        _recap_cache_dirty = False
+        try:
+            await asyncio.to_thread(write_json_file, RECAP_CACHE_FILE, dict(_recap_cache))
+        except Exception as e:
+            _recap_cache_dirty = True
+            logger.error("Error saving recap cache: %s", e)
 
-# Global variables
-scheduler = AsyncIOScheduler()
-config = load_config()
-standup_users = load_users()
+# Load the responses recorded today, dropping any saved on an earlier day
+def load_responses(today_str):
+    try:
+        saved = read_json_file(RESPONSES_FILE)
+    except (FileNotFoundError, ValueError):
+        return {}
+    return {int(user_id): response for user_id, response in saved.get(today_str, {}).items()}
+
+def responses_snapshot():
+    """Return today_responses in the on-disk form, {date: {user_id: response}}"""
+    return {_today_str: {str(user_id): response for user_id, response in today_responses.items()}}
+
+async def save_responses():
+    """Write today's responses to disk, logging failures instead of raising"""
+    try:
+        await asyncio.to_thread(write_json_file, RESPONSES_FILE, responses_snapshot())
+    except Exception as e:
+        logger.error("Error saving responses: %s", e)
+
+# Global variables; scheduler, config, schedule and users are loaded by build_bot
+scheduler = None
+config = None
+_saved_config = None  # Last config known to be on disk
+schedule = None
+standup_users = set()
+_saved_users = None  # Last user list known to be on disk
 today_responses = {}  # Track responses for the day
+RESPONSES_FLUSH_DELAY = 2.0  # seconds; a burst of updates is written once
+_responses_flush_handle = None  # Pending call_later for flush_responses
+_users_dirty = False  # Set when standup_users changes; flushed by flush_users
+_background_tasks = set()  # Keeps fire-and-forget tasks referenced until they finish
+standup_channel = None  # Cached by ensure_standup_channel and on_ready
+reminder_template = None  # string.Template built by build_reminder_template
+_today_str = None  # Set by build_bot and refreshed by reset_daily_tracking
+
+# Members fetched over REST, keyed by user ID -> (fetched_at, member)
+MEMBER_CACHE_TTL = 300  # seconds
+_member_cache: dict[int, tuple[float, discord.Member]] = {}
+
+HISTORY_CONCURRENCY = 5  # Max channel history requests in flight per recap
+REQUEST_CONCURRENCY = 5  # Max outbound sends/fetches in flight through bounded_request
+_request_semaphore = None  # Created on first use so it binds to the running event loop
+SEND_INTERVAL = 0.25  # seconds between sends to one channel, under Discord's 5 per 5 seconds
+_send_queues: dict[int, asyncio.Queue] = {}  # Per-channel queues drained by send_worker
+TIME_RE = re.compile(r'([01]?\d|2[0-3]):([0-5]\d)')  # HH:MM, 24-hour
+MESSAGE_LIMIT = 2000  # Discord's maximum message length
+SYNC_COOLDOWN = 60  # Minimum seconds between slash command syncs
+_last_sync_ts = None  # time.monotonic() of the last sync
+
+# Parsed recap messages, keyed by "channel_id:day_start" -> {'last_message_id', 'complete', 'day_start', 'updates'}
+RECAP_CACHE_MAX_AGE = 8 * 24 * 60 * 60  # seconds
+_recap_cache = {}
+_recap_cache_dirty = False
+_recap_cache_lock = None  # Created on first use so it binds to the running event loop
 
-@bot.event
 async def on_ready():
     """When the bot starts up"""
-    logger.info(f'Logged in as {bot.user.name} ({bot.user.id})')
+    global standup_channel
+    logger.info("Logged in as %s (%s)", bot.user.name, bot.user.id)
     
-    try:
-        synced = await bot.tree.sync()
-        logger.info(f"Synced {len(synced)} command(s)")
-    except Exception as e:
-        logger.error(f"Failed to sync commands: {e}")
+    # Refresh the cached channel; a full reconnect rebuilds the channel cache
+    standup_channel = bot.get_channel(STANDUP_CHANNEL_ID)
+    
+    # on_ready fires again after reconnects; the commands only need syncing once per process
+    if _last_sync_ts is None:
+        try:
+            synced = await sync_commands()
+            logger.info("Synced %s command(s)", len(synced))
+        except Exception as e:
+            logger.error("Failed to sync commands: %s", e)
     
     setup_scheduler()
+    if not scheduler.running:
+        scheduler.start()
+    
+    if not flush_users.is_running():
+        flush_users.start()
     logger.info("Bot is ready")
 
+def sync_on_cooldown():
+    """Whether commands were synced less than SYNC_COOLDOWN seconds ago"""
+    return _last_sync_ts is not None and time.monotonic() - _last_sync_ts < SYNC_COOLDOWN
+
+async def sync_commands():
+    """Sync slash commands to the standup server, which takes effect immediately unlike a global sync"""
+    global _last_sync_ts
+    if _last_sync_ts is None:
+        # Commands are only registered on the guild, so this clears any that older
+        # versions registered globally and that would otherwise show up twice
+        await bot.tree.sync()
+    synced = await bot.tree.sync(guild=discord.Object(id=GUILD_ID))
+    _last_sync_ts = time.monotonic()
+    return synced
+
+def build_reminder_template():
+    """Pre-render the reminder message from the config, leaving only the date and mentions to fill in"""
+    global reminder_template
+    # Escape "$" in the user-supplied template so only $date and $mentions are substituted
+    standup_format = config['standup_format'].replace('$', '$$')
+    reminder_template = string.Template(
+        f"📝 **Daily Standup for $date**\n\n🔔 **Good morning $mentions!** Please fill in your standups before {config['deadline_time']} AM!"
+        f"\n\n**Standup Template:**\n\n{standup_format}\n\n*Reply with your update starting with \"Standup:\"*"
+    )
+
 def setup_scheduler():
-    # Clear existing jobs
-    scheduler.remove_all_jobs()
+    build_reminder_template()
     
-    # Get timezone
-    tz = pytz.timezone(config['timezone'])
+    # Get timezone and the days reminders run on
+    tz = schedule.tz
+    day_of_week = 'mon-fri' if config['weekdays_only'] else '*'
     
-    # Parse reminder and deadline times
-    reminder_hour, reminder_minute = map(int, config['reminder_time'].split(':'))
-    deadline_hour, deadline_minute = map(int, config['deadline_time'].split(':'))
+    jobs = [
+        # Initial reminder
+        ('standup_reminder', send_standup_reminder,
+         CronTrigger(hour=schedule.reminder_hour, minute=schedule.reminder_minute, day_of_week=day_of_week, timezone=tz)),
+        # Second reminder at 10:15 AM
+        ('second_reminder', send_second_reminder,
+         CronTrigger(hour=10, minute=15, day_of_week=day_of_week, timezone=tz)),
+        # Follow-up notification
+        ('standup_followup', send_followup_notification,
+         CronTrigger(hour=schedule.deadline_hour, minute=schedule.deadline_minute, day_of_week=day_of_week, timezone=tz)),
+        # Daily reset at midnight
+        ('daily_reset', daily_reset,
+         CronTrigger(hour=0, minute=0, timezone=tz)),
+    ]
     
-    # Schedule initial reminder
-    scheduler.add_job(
-        send_standup_reminder,
-        CronTrigger(hour=reminder_hour, minute=reminder_minute, day_of_week='mon-fri' if config['weekdays_only'] else '*', timezone=tz),
-        id='standup_reminder',
-        replace_existing=True
-    )
+    # Update existing jobs in place; only add them the first time
+    for job_id, func, trigger in jobs:
+        try:
+            scheduler.reschedule_job(job_id, trigger=trigger)
+        except JobLookupError:
+            scheduler.add_job(func, trigger, id=job_id, coalesce=True, misfire_grace_time=300, max_instances=1)
     
-    # Schedule second reminder at 10:15 AM
-    scheduler.add_job(
-        send_second_reminder,
-        CronTrigger(hour=10, minute=15, day_of_week='mon-fri' if config['weekdays_only'] else '*', timezone=tz),
-        id='second_reminder',
-        replace_existing=True
-    )
+    logger.info("Scheduled first reminder at %s AM, second reminder at 10:15 AM, and follow-ups at %s AM %s", config['reminder_time'], config['deadline_time'], config['timezone'])
+
+async def bounded_request(make_request):
+    """Run a Discord API call with bounded concurrency, retrying once if it is rate limited"""
+    global _request_semaphore
+    if _request_semaphore is None:
+        _request_semaphore = asyncio.Semaphore(REQUEST_CONCURRENCY)
     
-    # Schedule follow-up notification
-    scheduler.add_job(
-        send_followup_notification,
-        CronTrigger(hour=deadline_hour, minute=deadline_minute, day_of_week='mon-fri' if config['weekdays_only'] else '*', timezone=tz),
-        id='standup_followup',
-        replace_existing=True
-    )
+    try:
+        async with _request_semaphore:
+            return await make_request()
+    except discord.HTTPException as e:
+        if e.status != 429:
+            raise
+        try:
+            retry_after = float(e.response.headers.get('Retry-After', 1.0))
+        except (AttributeError, ValueError):
+            retry_after = 1.0
+        logger.warning("Rate limited, retrying in %.2fs", retry_after)
     
-    # Schedule daily reset at midnight
-    scheduler.add_job(
-        reset_daily_tracking,
-        CronTrigger(hour=0, minute=0, timezone=tz),
-        id='daily_reset',
-        replace_existing=True
-    )
+    # Wait outside the semaphore so other requests can use the slot meanwhile
+    await asyncio.sleep(retry_after + random.random() * 0.25)
+    async with _request_semaphore:
+        return await make_request()
+
+async def send_worker(queue):
+    """Send queued messages for one channel in order, spaced out to stay under its rate limit"""
+    while True:
+        make_request, future = await queue.get()
+        try:
+            result = await bounded_request(make_request)
+            if not future.done():
+                future.set_result(result)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            queue.task_done()
+        await asyncio.sleep(SEND_INTERVAL)
+
+async def enqueue_send(channel_id, make_request):
+    """Queue a send on a channel's worker and wait for the result"""
+    queue = _send_queues.get(channel_id)
+    if queue is None:
+        queue = _send_queues[channel_id] = asyncio.Queue()
+        task = asyncio.create_task(send_worker(queue))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
     
-    logger.info(f"Scheduled first reminder at {config['reminder_time']} AM, second reminder at 10:15 AM, and follow-ups at {config['deadline_time']} AM {config['timezone']}")
+    future = asyncio.get_running_loop().create_future()
+    await queue.put((make_request, future))
+    return await future
 
 async def ensure_standup_channel():
     """Verify the standup channel exists and return it"""
-    channel = bot.get_channel(STANDUP_CHANNEL_ID)
-    if not channel:
-        logger.error(f"Could not find channel with ID {STANDUP_CHANNEL_ID}")
-    return channel
+    global standup_channel
+    if not standup_channel:
+        standup_channel = bot.get_channel(STANDUP_CHANNEL_ID)
+        if not standup_channel:
+            logger.error("Could not find channel with ID %s", STANDUP_CHANNEL_ID)
+    return standup_channel
+
+def get_cached_member(guild, uid, now):
+    """Look up a member in the gateway cache, falling back to members fetched since now - MEMBER_CACHE_TTL"""
+    member = guild.get_member(uid)
+    if member:
+        return member
+    
+    cached = _member_cache.get(uid)
+    if cached and now - cached[0] < MEMBER_CACHE_TTL:
+        return cached[1]
+    return None
+
+async def fetch_members(guild, user_ids):
+    """Fetch members over the API concurrently, skipping any that can't be fetched"""
+    results = await asyncio.gather(
+        *[bounded_request(lambda uid=uid: guild.fetch_member(uid)) for uid in user_ids],
+        return_exceptions=True
+    )
+    
+    members = []
+    for uid, result in zip(user_ids, results):
+        if isinstance(result, discord.NotFound):
+            continue  # Reported by the caller as not in the server
+        if isinstance(result, Exception):
+            logger.error("Error fetching member %s: %s", uid, result)
+            continue
+        members.append(result)
+    return members
+
+async def get_or_fetch_members(guild, user_ids):
+    """Resolve members by ID, batching cache misses into gateway member queries"""
+    members = {}
+    misses = []
+    now = time.monotonic()
+    for uid in user_ids:
+        member = get_cached_member(guild, uid, now)
+        if member:
+            members[uid] = member
+        else:
+            misses.append(uid)
+    
+    if misses:
+        # The gateway accepts at most 100 user IDs per member request
+        chunks = [misses[i:i+100] for i in range(0, len(misses), 100)]
+        results = await asyncio.gather(
+            *[guild.query_members(user_ids=chunk, limit=len(chunk), cache=True) for chunk in chunks],
+            return_exceptions=True
+        )
+        
+        fetched = []
+        failed = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                logger.warning("Member query for %s users failed (%s), fetching individually", len(chunk), result)
+                failed.extend(chunk)
+            else:
+                fetched.extend(result)
+        
+        if failed:
+            fetched.extend(await fetch_members(guild, failed))
+        
+        now = time.monotonic()
+        for member in fetched:
+            _member_cache[member.id] = (now, member)
+            members[member.id] = member
+        
+        for uid in misses:
+            if uid not in members:
+                logger.warning("User ID %s not found in the server", uid)
+    
+    return members
+
+def standup_mentions(only_missing=False):
+    """Mention strings for standup users, optionally only those who haven't responded"""
+    # Discord renders <@id> itself, so no member lookup is needed
+    user_ids = sorted(standup_users - today_responses.keys() if only_missing else standup_users)
+    return [f"<@{user_id}>" for user_id in user_ids]
 
 async def send_standup_reminder():
     """Send the standup reminder in the standups channel"""
@@ -161,34 +481,19 @@ async def send_standup_reminder():
         # Reset today's responses for the new day
         reset_daily_tracking()
         
-        # Get guild to fetch members
-        guild = bot.get_guild(GUILD_ID)
-        if not guild:
-            logger.error(f"Could not find guild with ID {GUILD_ID}")
-            return
-            
         # Create mention string for all users
-        mentions = []
-        for user_id in standup_users:
-            try:
-                member = await guild.fetch_member(int(user_id))
-                if member:
-                    mentions.append(member.mention)
-            except Exception as e:
-                logger.error(f"Error fetching member {user_id}: {e}")
-                
-        mention_str = " ".join(mentions) if mentions else "everyone"
-        
-        # Create today's date string
-        today_str = datetime.datetime.now().strftime("%m/%d/%Y")
+        mentions = standup_mentions()
+        # Fall back to "team" rather than "everyone", which looks like an @everyone ping
+        mention_str = " ".join(mentions) or "team"
         
         # Send reminder message in the channel
-        await channel.send(f"📝 **Daily Standup for {today_str}**\n\n🔔 **Good morning {mention_str}!** Please fill in your standups before {config['deadline_time']} AM!\n\n**Standup Template:**\n\n{config['standup_format']}\n\n*Reply with your update starting with \"Standup:\"*")
+        reminder = reminder_template.substitute(date=_today_str, mentions=mention_str)
+        await enqueue_send(channel.id, lambda: channel.send(reminder))
         
-        logger.info(f"Sent standup reminder to {len(mentions)} users")
+        logger.info("Sent standup reminder to %s users", len(mentions))
         
     except Exception as e:
-        logger.error(f"Error sending standup reminder: {e}")
+        logger.error("Error sending standup reminder: %s", e)
 
 async def send_followup_notification():
     """Send follow-up notification mentioning users who haven't responded"""
@@ -198,122 +503,136 @@ async def send_followup_notification():
         if not channel:
             return
         
-        # Get guild to fetch members
-        guild = bot.get_guild(GUILD_ID)
-        if not guild:
-            logger.error(f"Could not find guild with ID {GUILD_ID}")
-            return
-            
-        # Get members who haven't responded
-        missing_users = []
-        for user_id in standup_users:
-            if user_id not in today_responses:
-                try:
-                    member = await guild.fetch_member(int(user_id))
-                    if member:
-                        missing_users.append(member)
-                except discord.NotFound:
-                    logger.warning(f"User ID {user_id} not found in the server")
-                except Exception as e:
-                    logger.error(f"Error fetching member {user_id}: {e}")
+        # Get users who haven't responded
+        missing_users = standup_mentions(only_missing=True)
         
         if missing_users:
             # Create mention string
-            mentions = " ".join([member.mention for member in missing_users])
+            mentions = " ".join(missing_users)
             
             # Send follow-up message
-            await channel.send(f"⏰ **Reminder!** The following team members still need to submit their standups: {mentions}")
-            logger.info(f"Sent follow-up notification to {len(missing_users)} users")
+            await enqueue_send(channel.id, lambda: channel.send(f"⏰ **Reminder!** The following team members still need to submit their standups: {mentions}"))
+            logger.info("Sent follow-up notification to %s users", len(missing_users))
         else:
-            await channel.send("✅ Great job team! Everyone has submitted their standup for today!")
+            await enqueue_send(channel.id, lambda: channel.send("✅ Great job team! Everyone has submitted their standup for today!"))
             logger.info("All users have submitted their standups")
             
     except Exception as e:
-        logger.error(f"Error sending follow-up notification: {e}")
+        logger.error("Error sending follow-up notification: %s", e)
 
 async def send_second_reminder():
     """Send a second reminder to users who haven't responded yet"""
     try:
+        # Nothing to send if everyone has already responded
+        if standup_users <= today_responses.keys():
+            logger.info("All users have submitted their standups, skipping second reminder")
+            return
+        
         # Get the standup channel
         channel = await ensure_standup_channel()
         if not channel:
             return
         
-        # Get guild to fetch members
-        guild = bot.get_guild(GUILD_ID)
-        if not guild:
-            logger.error(f"Could not find guild with ID {GUILD_ID}")
-            return
-            
-        # Get members who haven't responded
-        missing_users = []
-        for user_id in standup_users:
-            if user_id not in today_responses:
-                try:
-                    member = await guild.fetch_member(int(user_id))
-                    if member:
-                        missing_users.append(member)
-                except discord.NotFound:
-                    logger.warning(f"User ID {user_id} not found in the server")
-                except Exception as e:
-                    logger.error(f"Error fetching member {user_id}: {e}")
+        # Get users who haven't responded; the check above guarantees there is at least one
+        missing_users = standup_mentions(only_missing=True)
+        mentions = " ".join(missing_users)
         
-        if missing_users:
-            # Create mention string
-            mentions = " ".join([member.mention for member in missing_users])
-            
-            # Send second reminder message
-            await channel.send(f"⏰ **Second Reminder!** The following team members still need to submit their standups (due by 11:00 AM): {mentions}")
-            logger.info(f"Sent second reminder to {len(missing_users)} users")
+        # Send second reminder message
+        await enqueue_send(channel.id, lambda: channel.send(f"⏰ **Second Reminder!** The following team members still need to submit their standups (due by 11:00 AM): {mentions}"))
+        logger.info("Sent second reminder to %s users", len(missing_users))
             
     except Exception as e:
-        logger.error(f"Error sending second reminder: {e}")
+        logger.error("Error sending second reminder: %s", e)
+
+def mark_users_dirty():
+    """Flag the user list for the next flush_users write"""
+    global _users_dirty
+    _users_dirty = True
+
+@tasks.loop(seconds=2)
+async def flush_users():
+    """Write the user list to disk if it changed, coalescing bursts of edits into one write"""
+    global _users_dirty
+    if not _users_dirty:
+        return
+    
+    _users_dirty = False
+    try:
+        await save_users(standup_users)
+    except Exception as e:
+        _users_dirty = True
+        logger.error("Error saving user list: %s", e)
+
+@flush_users.after_loop
+async def flush_users_on_stop():
+    # Don't lose edits made just before shutdown
+    if _users_dirty:
+        write_json_file(USER_FILE, sorted(standup_users))
+    if _responses_flush_handle:
+        _responses_flush_handle.cancel()
+        write_json_file(RESPONSES_FILE, responses_snapshot())
+
+def mark_responses_dirty():
+    """Schedule a write of today_responses unless one is already pending"""
+    global _responses_flush_handle
+    if _responses_flush_handle is None:
+        _responses_flush_handle = asyncio.get_running_loop().call_later(RESPONSES_FLUSH_DELAY, flush_responses)
+
+def flush_responses():
+    """Start writing today_responses in the background"""
+    global _responses_flush_handle
+    _responses_flush_handle = None
+    task = asyncio.create_task(save_responses())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+async def daily_reset():
+    """Midnight job; a coroutine so the reset runs on the event loop rather than in an executor thread"""
+    reset_daily_tracking()
 
 def reset_daily_tracking():
     """Reset tracking of responses for a new day"""
-    global today_responses
+    global today_responses, _today_str
     today_responses = {}
+    _today_str = format_date(datetime.datetime.now(schedule.tz))
+    mark_responses_dirty()
     logger.info("Reset daily tracking of standup responses")
 
-@bot.tree.command(name="notify", description="Add a user to the standup notification list")
+@app_commands.command(name="notify", description="Add a user to the standup notification list")
 async def notify_command(interaction: discord.Interaction, user: discord.Member):
     """Add a user to the standup notification list"""
     if not interaction.user.guild_permissions.manage_messages:
         await interaction.response.send_message("You don't have permission to use this command.", ephemeral=True)
         return
-        
-    user_id = str(user.id)
     
-    if user_id in standup_users:
+    if user.id in standup_users:
         await interaction.response.send_message(f"{user.display_name} is already on the standup list.", ephemeral=True)
         return
     
-    standup_users.append(user_id)
-    save_users(standup_users)
+    standup_users.add(user.id)
+    mark_users_dirty()
     
     await interaction.response.send_message(f"Added {user.mention} to the standup notification list.", ephemeral=False)
-    logger.info(f"Added user {user.display_name} ({user_id}) to standup list")
+    logger.info("Added user %s (%s) to standup list", user.display_name, user.id)
 
-@bot.tree.command(name="remove", description="Remove a user from the standup notification list")
+@app_commands.command(name="remove", description="Remove a user from the standup notification list")
 async def remove_command(interaction: discord.Interaction, user: discord.Member):
     """Remove a user from the standup notification list"""
     if not interaction.user.guild_permissions.manage_messages:
         await interaction.response.send_message("You don't have permission to use this command.", ephemeral=True)
         return
-        
-    user_id = str(user.id)
     
-    if user_id not in standup_users:
+    if user.id not in standup_users:
         await interaction.response.send_message(f"{user.display_name} is not on the standup list.", ephemeral=True)
         return
     
-    standup_users.remove(user_id)
-    save_users(standup_users)
+    standup_users.discard(user.id)
+    mark_users_dirty()
     
     await interaction.response.send_message(f"Removed {user.mention} from the standup notification list.", ephemeral=False)
-    logger.info(f"Removed user {user.display_name} ({user_id}) from standup list")
+    logger.info("Removed user %s (%s) from standup list", user.display_name, user.id)
 
-@bot.tree.command(name="list-users", description="List all users on the standup notification list")
+@app_commands.command(name="list-users", description="List all users on the standup notification list")
 async def list_users_command(interaction: discord.Interaction):
     """List all users on the standup notification list"""
     if not interaction.user.guild_permissions.manage_messages:
@@ -327,17 +646,18 @@ async def list_users_command(interaction: discord.Interaction):
     guild = interaction.guild
     user_list = []
     
-    for user_id in standup_users:
-        try:
-            member = await guild.fetch_member(int(user_id))
-            if member:
-                user_list.append(f"• {member.mention} ({member.display_name})")
-        except:
+    members = await get_or_fetch_members(guild, list(standup_users))
+    
+    for user_id in sorted(standup_users):
+        member = members.get(user_id)
+        if member:
+            user_list.append(f"• {member.mention} ({member.display_name})")
+        else:
             user_list.append(f"• Unknown User (ID: {user_id})")
     
     await interaction.response.send_message(f"**Standup Notification List:**\n" + "\n".join(user_list), ephemeral=False)
 
-@bot.tree.command(name="set-reminder-time", description="Set the time for the daily standup reminder")
+@app_commands.command(name="set-reminder-time", description="Set the time for the daily standup reminder")
 async def set_reminder_time_command(interaction: discord.Interaction, time: str):
     """Set the time for the daily standup reminder (format: HH:MM)"""
     if not interaction.user.guild_permissions.manage_messages:
@@ -345,25 +665,24 @@ async def set_reminder_time_command(interaction: discord.Interaction, time: str)
         return
     
     # Validate time format
-    try:
-        hour, minute = map(int, time.split(':'))
-        if hour < 0 or hour > 23 or minute < 0 or minute > 59:
-            raise ValueError("Invalid time values")
-    except:
+    match = TIME_RE.fullmatch(time)
+    if not match:
         await interaction.response.send_message("Invalid time format. Please use HH:MM (24-hour format).", ephemeral=True)
         return
+    hour, minute = int(match[1]), int(match[2])
     
     # Update config
     config['reminder_time'] = time
-    save_config(config)
+    await save_config(config)
+    schedule.reminder_hour, schedule.reminder_minute = hour, minute
     
     # Reconfigure scheduler
     setup_scheduler()
     
     await interaction.response.send_message(f"Standup reminder time set to {time} {config['timezone']}.", ephemeral=False)
-    logger.info(f"Reminder time updated to {time}")
+    logger.info("Reminder time updated to %s", time)
 
-@bot.tree.command(name="set-deadline", description="Set the time for the follow-up standup notification")
+@app_commands.command(name="set-deadline", description="Set the time for the follow-up standup notification")
 async def set_deadline_command(interaction: discord.Interaction, time: str):
     """Set the time for the follow-up standup notification (format: HH:MM)"""
     if not interaction.user.guild_permissions.manage_messages:
@@ -371,25 +690,24 @@ async def set_deadline_command(interaction: discord.Interaction, time: str):
         return
     
     # Validate time format
-    try:
-        hour, minute = map(int, time.split(':'))
-        if hour < 0 or hour > 23 or minute < 0 or minute > 59:
-            raise ValueError("Invalid time values")
-    except:
+    match = TIME_RE.fullmatch(time)
+    if not match:
         await interaction.response.send_message("Invalid time format. Please use HH:MM (24-hour format).", ephemeral=True)
         return
+    hour, minute = int(match[1]), int(match[2])
     
     # Update config
     config['deadline_time'] = time
-    save_config(config)
+    await save_config(config)
+    schedule.deadline_hour, schedule.deadline_minute = hour, minute
     
     # Reconfigure scheduler
     setup_scheduler()
     
     await interaction.response.send_message(f"Standup deadline and follow-up time set to {time} {config['timezone']}.", ephemeral=False)
-    logger.info(f"Deadline time updated to {time}")
+    logger.info("Deadline time updated to %s", time)
 
-@bot.tree.command(name="set-timezone", description="Set the timezone for the bot")
+@app_commands.command(name="set-timezone", description="Set the timezone for the bot")
 async def set_timezone_command(interaction: discord.Interaction, timezone: str):
     """Set the timezone for scheduling (e.g., America/Los_Angeles)"""
     if not interaction.user.guild_permissions.manage_messages:
@@ -398,148 +716,208 @@ async def set_timezone_command(interaction: discord.Interaction, timezone: str):
     
     # Validate timezone
     try:
-        pytz.timezone(timezone)
-    except:
+        tz = ZoneInfo(timezone)
+    # OSError covers region names like "America", which are directories in the tz database
+    except (ZoneInfoNotFoundError, ValueError, OSError):
         await interaction.response.send_message("Invalid timezone. Please use a valid timezone identifier (e.g., America/Los_Angeles).", ephemeral=True)
         return
     
     # Update config
     config['timezone'] = timezone
-    save_config(config)
+    await save_config(config)
+    schedule.tz = tz
     
     # Reconfigure scheduler
     setup_scheduler()
     
     await interaction.response.send_message(f"Timezone set to {timezone}.", ephemeral=False)
-    logger.info(f"Timezone updated to {timezone}")
+    logger.info("Timezone updated to %s", timezone)
 
-@bot.tree.command(name="daily-recap", description="Generate a report of today's standups")
+async def collect_day_messages(channel, day_start, day_end, semaphore, now):
+    """Collect (author name, content) pairs for user messages between day_start and day_end, oldest first"""
+    global _recap_cache_dirty
+    # Reuse the last pass if the day was already over when it ran, or nothing was posted since
+    key = f"{channel.id}:{day_start.isoformat()}"
+    cached = _recap_cache.get(key)
+    if cached and (cached['complete'] or cached['last_message_id'] == channel.last_message_id):
+        return cached['updates']
+    
+    last_message_id = channel.last_message_id
+    complete = now > day_end
+    updates = []
+    async with semaphore:
+        # Stop at the end of the window rather than passing before=, which makes the
+        # history iterator keep paging through later messages and filter them out
+        async for message in channel.history(limit=None, after=day_start, oldest_first=True):
+            if message.created_at > day_end:
+                break
+            if message.author != bot.user:  # Include all user messages, not just those with "Standup:" prefix
+                updates.append((message.author.display_name, message.content))
+    
+    _recap_cache[key] = {
+        'last_message_id': last_message_id,
+        'complete': complete,
+        'day_start': day_start.timestamp(),
+        'updates': updates
+    }
+    _recap_cache_dirty = True
+    return updates
+
+def pack_chunks(parts, limit):
+    """Group recap parts into strings of at most limit characters in one pass, splitting only parts that are too long on their own"""
+    chunks = []
+    current = []
+    size = 0
+    for part in parts:
+        pieces = [part[i:i+limit] for i in range(0, len(part), limit)] if len(part) > limit else [part]
+        for piece in pieces:
+            if current and size + len(piece) > limit:
+                chunks.append("".join(current))
+                current = []
+                size = 0
+            current.append(piece)
+            size += len(piece)
+    
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+async def send_recap(interaction, parts):
+    """Send a recap as interaction followups, split into numbered parts if it is too long"""
+    if sum(len(part) for part in parts) <= MESSAGE_LIMIT:
+        recap = "".join(parts)
+        await enqueue_send(interaction.channel_id, lambda: interaction.followup.send(recap, suppress_embeds=True))
+        return
+    
+    # Fill each chunk up to the limit less the "Part i/n" footer, repacking if the
+    # part count turns out to need a longer footer than assumed
+    footer_size = len("\n\n*Part 9/9*")
+    while True:
+        chunks = pack_chunks(parts, MESSAGE_LIMIT - footer_size)
+        needed = len(f"\n\n*Part {len(chunks)}/{len(chunks)}*")
+        if needed <= footer_size:
+            break
+        footer_size = needed
+    
+    # Parts go through the channel's send queue one at a time so they arrive in order
+    for i, chunk in enumerate(chunks):
+        content = f"{chunk}\n\n*Part {i+1}/{len(chunks)}*"
+        await enqueue_send(interaction.channel_id, lambda: interaction.followup.send(content, suppress_embeds=True))
+
+@app_commands.command(name="daily-recap", description="Generate a report of today's standups")
 async def daily_recap_command(interaction: discord.Interaction):
     """Generate a report of today's standups"""
     await interaction.response.defer(ephemeral=False)
     
     try:
         # Get the standup channel
-        channel = bot.get_channel(STANDUP_CHANNEL_ID)
+        channel = await ensure_standup_channel()
         if not channel:
             await interaction.followup.send("Could not find the standup channel.")
             return
             
         # Get today's date
-        today = datetime.datetime.now(pytz.timezone(config['timezone'])).date()
-        today_start = datetime.datetime.combine(today, datetime.time.min, tzinfo=pytz.timezone(config['timezone']))
-        today_end = datetime.datetime.combine(today, datetime.time.max, tzinfo=pytz.timezone(config['timezone']))
+        tz = schedule.tz
+        now = datetime.datetime.now(tz)
+        today = now.date()
+        today_start = datetime.datetime.combine(today, datetime.time.min, tzinfo=tz)
+        today_end = datetime.datetime.combine(today, datetime.time.max, tzinfo=tz)
         
-        # Get all messages from the standup channel for today
-        messages = []
-        async for message in channel.history(limit=200, after=today_start, before=today_end):
-            if message.author != bot.user:  # Include all user messages, not just those with "Standup:" prefix
-                messages.append(message)
+        # Get today's messages from the standup channel
+        today_updates = await collect_day_messages(channel, today_start, today_end, asyncio.Semaphore(1), now)
+        await save_recap_cache()
         
-        if not messages:
+        if not today_updates:
             await interaction.followup.send("No standup updates were found for today.")
             return
         
-        # Build the recap
-        today_str = today.strftime("%m/%d/%Y")
-        recap = f"# Standup Recap for {today_str}\n\n"
+        today_str = format_date(today)
+        parts: list[str] = []
         
-        for message in reversed(messages):  # Oldest first
-            # Format the user's message
-            recap += f"## {message.author.display_name}\n"
-            recap += f"{message.content}\n\n"
-            
-            # Add a separator
-            recap += "---\n\n"
+        for author_name, content in today_updates:
+            # Format the user's message with its separator as one part, so a chunk
+            # boundary never falls between a name and its update
+            parts.append(f"## {author_name}\n{content}\n\n---\n\n")
+        
+        # Attach the title to the first update so it never ends a chunk on its own
+        parts[0] = f"# Standup Recap for {today_str}\n\n{parts[0]}"
         
         # Send the recap
-        if len(recap) > 2000:
-            # Split into chunks if too long
-            chunks = [recap[i:i+1990] for i in range(0, len(recap), 1990)]
-            for i, chunk in enumerate(chunks):
-                await interaction.followup.send(f"{chunk}\n\n*Part {i+1}/{len(chunks)}*")
-        else:
-            await interaction.followup.send(recap)
+        await send_recap(interaction, parts)
             
-        logger.info(f"Generated daily recap with {len(messages)} updates")
+        logger.info("Generated daily recap with %s updates", len(today_updates))
         
     except Exception as e:
         await interaction.followup.send(f"Error generating recap: {str(e)}")
-        logger.error(f"Error generating daily recap: {e}")
+        logger.error("Error generating daily recap: %s", e)
 
-@bot.tree.command(name="weekly-recap", description="Generate a report of this week's standups")
+@app_commands.command(name="weekly-recap", description="Generate a report of this week's standups")
 async def weekly_recap_command(interaction: discord.Interaction):
     """Generate a report of this week's standups"""
     await interaction.response.defer(ephemeral=False)
     
     try:
         # Get standup channel
-        channel = bot.get_channel(STANDUP_CHANNEL_ID)
+        channel = await ensure_standup_channel()
         if not channel:
             await interaction.followup.send("Could not find the standup channel.")
             return
         
         # Calculate date range for this week (Monday to today)
-        current_tz = pytz.timezone(config['timezone'])
+        current_tz = schedule.tz
         today = datetime.datetime.now(current_tz)
-        start_of_week = today - datetime.timedelta(days=today.weekday())
-        start_of_week = datetime.datetime.combine(start_of_week.date(), datetime.time.min, tzinfo=current_tz)
+        start_of_week = today.date() - datetime.timedelta(days=today.weekday())
+        days = [start_of_week + datetime.timedelta(days=i) for i in range(today.weekday() + 1)]
         
-        # Get all messages from the standup channel for this week
-        messages_by_date = {}
+        # Fetch each day's messages concurrently, a few history requests at a time
+        semaphore = asyncio.Semaphore(HISTORY_CONCURRENCY)
+        day_results = await asyncio.gather(*[
+            collect_day_messages(
+                channel,
+                datetime.datetime.combine(day, datetime.time.min, tzinfo=current_tz),
+                datetime.datetime.combine(day, datetime.time.max, tzinfo=current_tz),
+                semaphore,
+                today
+            )
+            for day in days
+        ])
+        await save_recap_cache()
         
-        async for message in channel.history(limit=1000, after=start_of_week):
-            if message.author != bot.user:  # Include all user messages, not just those with "Standup:" prefix
-                msg_date = message.created_at.astimezone(current_tz)
-                date_str = msg_date.strftime("%m/%d/%Y")
-                
-                if date_str not in messages_by_date:
-                    messages_by_date[date_str] = []
-                    
-                messages_by_date[date_str].append(message)
-        
-        if not messages_by_date:
+        updates_by_date = {day: day_updates for day, day_updates in zip(days, day_results) if day_updates}
+        
+        if not updates_by_date:
             await interaction.followup.send("No standup updates were found for this week.")
             return
         
-        # Build the recap
-        recap = "# Weekly Standup Recap\n\n"
+        # Build the recap with one part per update, so a chunk boundary never falls
+        # between a name and its update or leaves a header or separator on its own
+        parts: list[str] = []
         total_updates = 0
         
         # Process each day
-        for date_str in sorted(messages_by_date.keys()):
-            day_messages = messages_by_date[date_str]
-            
-            # Add day header
-            recap += f"## {date_str} ({len(day_messages)} updates)\n\n"
-            total_updates += len(day_messages)
-            
-            # Add each update
-            for message in reversed(day_messages):  # Oldest first
-                recap += f"### {message.author.display_name}\n"
-                recap += f"{message.content}\n\n"
+        for day in sorted(updates_by_date):
+            day_updates = updates_by_date[day]
+            day_parts = [f"### {author_name}\n{content}\n\n" for author_name, content in day_updates]
+            total_updates += len(day_updates)
             
-            # Add day separator
-            recap += "---\n\n"
+            # Attach the day header to its first update and the day separator to its last
+            day_parts[0] = f"## {format_date(day)} ({len(day_updates)} updates)\n\n{day_parts[0]}"
+            day_parts[-1] += "---\n\n"
+            parts.extend(day_parts)
         
-        # Add summary
-        recap = f"# Weekly Standup Recap ({total_updates} total updates)\n\n" + recap[recap.find("\n\n")+2:]
+        # Add summary to the first part, now that the total is known
+        parts[0] = f"# Weekly Standup Recap ({total_updates} total updates)\n\n{parts[0]}"
         
         # Send the recap in chunks if needed
-        if len(recap) > 2000:
-            chunks = [recap[i:i+1990] for i in range(0, len(recap), 1990)]
-            for i, chunk in enumerate(chunks):
-                await interaction.followup.send(f"{chunk}\n\n*Part {i+1}/{len(chunks)}*")
-        else:
-            await interaction.followup.send(recap)
+        await send_recap(interaction, parts)
             
-        logger.info(f"Generated weekly recap with {total_updates} updates")
+        logger.info("Generated weekly recap with %s updates", total_updates)
         
     except Exception as e:
         await interaction.followup.send(f"Error generating weekly recap: {str(e)}")
-        logger.error(f"Error generating weekly recap: {e}")
+        logger.error("Error generating weekly recap: %s", e)
 
-@bot.tree.command(name="set-standup-format", description="Set the standup format template")
+@app_commands.command(name="set-standup-format", description="Set the standup format template")
 async def set_standup_format_command(interaction: discord.Interaction, format: str):
     """Set the standup format template"""
     if not interaction.user.guild_permissions.manage_messages:
@@ -548,12 +926,13 @@ async def set_standup_format_command(interaction: discord.Interaction, format: s
     
     # Update config
     config['standup_format'] = format
-    save_config(config)
+    await save_config(config)
+    build_reminder_template()
     
     await interaction.response.send_message(f"Standup format template updated!", ephemeral=False)
-    logger.info(f"Standup format template updated")
+    logger.info("Standup format template updated")
 
-@bot.tree.command(name="test-reminder", description="Test the standup reminder (admin only)")
+@app_commands.command(name="test-reminder", description="Test the standup reminder (admin only)")
 async def test_reminder_command(interaction: discord.Interaction):
     """Test the standup reminder functionality"""
     if not interaction.user.guild_permissions.administrator:
@@ -566,10 +945,10 @@ async def test_reminder_command(interaction: discord.Interaction):
         await send_standup_reminder()
         logger.info("Test reminder sent successfully")
     except Exception as e:
-        logger.error(f"Error sending test reminder: {e}")
+        logger.error("Error sending test reminder: %s", e)
         await interaction.followup.send(f"Error: {str(e)}", ephemeral=True)
 
-@bot.tree.command(name="test-followup", description="Test the followup notification (admin only)")
+@app_commands.command(name="test-followup", description="Test the followup notification (admin only)")
 async def test_followup_command(interaction: discord.Interaction):
     """Test the followup notification functionality"""
     if not interaction.user.guild_permissions.administrator:
@@ -582,10 +961,10 @@ async def test_followup_command(interaction: discord.Interaction):
         await send_followup_notification()
         logger.info("Test followup sent successfully")
     except Exception as e:
-        logger.error(f"Error sending test followup: {e}")
+        logger.error("Error sending test followup: %s", e)
         await interaction.followup.send(f"Error: {str(e)}", ephemeral=True)
 
-@bot.tree.command(name="test-second-reminder", description="Test the second reminder notification (admin only)")
+@app_commands.command(name="test-second-reminder", description="Test the second reminder notification (admin only)")
 async def test_second_reminder_command(interaction: discord.Interaction):
     """Test the second reminder functionality"""
     if not interaction.user.guild_permissions.administrator:
@@ -598,44 +977,169 @@ async def test_second_reminder_command(interaction: discord.Interaction):
         await send_second_reminder()
         logger.info("Test second reminder sent successfully")
     except Exception as e:
-        logger.error(f"Error sending test second reminder: {e}")
+        logger.error("Error sending test second reminder: %s", e)
         await interaction.followup.send(f"Error: {str(e)}", ephemeral=True)
 
-@bot.tree.command(name="sync", description="Sync slash commands to the server (admin only)")
+@app_commands.command(name="sync", description="Sync slash commands to the server (admin only)")
 async def sync_command(interaction: discord.Interaction):
     """Sync slash commands with the server"""
     if not interaction.user.guild_permissions.administrator:
         await interaction.response.send_message("You must be an administrator to use this command.", ephemeral=True)
         return
+    
+    if sync_on_cooldown():
+        await interaction.response.send_message(f"Commands were synced less than {SYNC_COOLDOWN} seconds ago. Try again shortly.", ephemeral=True)
+        return
         
     await interaction.response.defer(ephemeral=True)
     
     try:
-        synced = await bot.tree.sync()
+        synced = await sync_commands()
         await interaction.followup.send(f"Synced {len(synced)} command(s) successfully!", ephemeral=True)
-        logger.info(f"Commands synced by {interaction.user.display_name}")
+        logger.info("Commands synced by %s", interaction.user.display_name)
     except Exception as e:
         await interaction.followup.send(f"Failed to sync commands: {str(e)}", ephemeral=True)
-        logger.error(f"Failed to sync commands: {e}")
+        logger.error("Failed to sync commands: %s", e)
+
+async def add_reaction_safely(message, emoji):
+    """Add a reaction to a message, logging failures instead of raising"""
+    try:
+        await bounded_request(lambda: message.add_reaction(emoji))
+    except discord.HTTPException as e:
+        logger.warning("Could not add reaction to message %s: %s", message.id, e)
 
-@bot.event
 async def on_message(message):
-    # Ignore bot messages
-    if message.author.bot:
+    # Only track user messages in the standup channel (all of them, not just those with "Standup:" prefix).
+    # The channel check comes first since most messages are outside the standup channel.
+    if message.channel.id != STANDUP_CHANNEL_ID or message.author.bot:
         return
     
-    # Check if message is in the standup channel (track all messages, not just those with "Standup:" prefix)
-    if message.channel.id == STANDUP_CHANNEL_ID:
-        # Mark this user as having responded
-        today_responses[str(message.author.id)] = {
-            'timestamp': datetime.datetime.now().timestamp(),
-            'content': message.content
-        }
-        logger.info(f"Recorded standup update from {message.author.display_name}")
-        
-        # Add a reaction to acknowledge
-        await message.add_reaction("✅")
+    # Mark this user as having responded
+    today_responses[message.author.id] = {
+        'timestamp': time.time(),
+        'content': message.content
+    }
+    mark_responses_dirty()
+    logger.info("Recorded standup update from %s", message.author.display_name)
+    
+    # Add a reaction to acknowledge, without waiting on the request
+    task = asyncio.create_task(add_reaction_safely(message, "✅"))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+async def on_guild_channel_delete(channel):
+    # Forget the cached standup channel if it is deleted
+    global standup_channel
+    if channel.id == STANDUP_CHANNEL_ID:
+        standup_channel = None
+        logger.warning("Standup channel %s was deleted", STANDUP_CHANNEL_ID)
+
+async def on_member_remove(member):
+    # Drop stale cache entries for members who leave the server
+    _member_cache.pop(member.id, None)
+
+async def forget_recap_days(channel_id, message_ids):
+    """Drop cached recap days containing the given messages, so the next recap refetches them"""
+    global _recap_cache_dirty
+    if channel_id != STANDUP_CHANNEL_ID:
+        return
+    
+    # A message's ID encodes when it was posted, which gives the day it is cached under
+    for message_id in message_ids:
+        posted = discord.utils.snowflake_time(message_id).astimezone(schedule.tz)
+        day_start = datetime.datetime.combine(posted.date(), datetime.time.min, tzinfo=schedule.tz)
+        if _recap_cache.pop(f"{channel_id}:{day_start.isoformat()}", None):
+            _recap_cache_dirty = True
+    
+    await save_recap_cache()
+
+async def on_raw_message_edit(payload):
+    await forget_recap_days(payload.channel_id, [payload.message_id])
+
+async def on_raw_message_delete(payload):
+    await forget_recap_days(payload.channel_id, [payload.message_id])
+
+async def on_raw_bulk_message_delete(payload):
+    await forget_recap_days(payload.channel_id, payload.message_ids)
+
+def build_bot():
+    """Load settings and saved state, then create the bot with its events and commands registered"""
+    global TOKEN, STANDUP_CHANNEL_ID, GUILD_ID, bot, scheduler, config, _saved_config, schedule, standup_users, _saved_users, _recap_cache, _today_str, today_responses
+    
+    # Load environment variables
+    load_dotenv()
+    TOKEN = os.getenv('DISCORD_TOKEN')
+    STANDUP_CHANNEL_ID = int(os.getenv('STANDUP_CHANNEL_ID'))
+    GUILD_ID = int(os.getenv('GUILD_ID'))
+    
+    # Ensure our directories exist, then load saved state
+    os.makedirs('db', exist_ok=True)
+    config = load_config()
+    _saved_config = dict(config)
+    schedule = parse_schedule(config)
+    standup_users = load_users()
+    _saved_users = sorted(standup_users)
+    _recap_cache = load_recap_cache()
+    _today_str = format_date(datetime.datetime.now(schedule.tz))
+    today_responses = load_responses(_today_str)
+    
+    # Coalesce missed runs into one and give jobs 5 minutes of grace, so a stalled
+    # event loop delays a reminder instead of silently dropping it
+    scheduler = AsyncIOScheduler(
+        job_defaults={'coalesce': True, 'max_instances': 1, 'misfire_grace_time': 300},
+        executors={'default': {'type': 'asyncio'}}
+    )
+    
+    # Bot configuration with all intents
+    intents = discord.Intents.default()
+    intents.message_content = True
+    intents.members = True
+    intents.reactions = True
+    bot = commands.Bot(command_prefix="/", intents=intents, member_cache_flags=discord.MemberCacheFlags.all())
+    
+    for event in (
+        on_ready,
+        on_message,
+        on_guild_channel_delete,
+        on_member_remove,
+        on_raw_message_edit,
+        on_raw_message_delete,
+        on_raw_bulk_message_delete,
+    ):
+        bot.event(event)
+    
+    # Register commands on the standup server only; see sync_commands
+    guild = discord.Object(id=GUILD_ID)
+    for command in (
+        notify_command,
+        remove_command,
+        list_users_command,
+        set_reminder_time_command,
+        set_deadline_command,
+        set_timezone_command,
+        daily_recap_command,
+        weekly_recap_command,
+        set_standup_format_command,
+        test_reminder_command,
+        test_followup_command,
+        test_second_reminder_command,
+        sync_command,
+    ):
+        bot.tree.add_command(command, guild=guild)
+    
+    return bot
 
 # Run the bot
 if __name__ == "__main__":
-    bot.run(TOKEN)
\ No newline at end of file
+    setup_logging()
+    
+    # Use uvloop's faster event loop where it is available (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    # discord.py would otherwise add its own stderr handler, duplicating every
+    # record and writing it from the event loop
+    build_bot().run(TOKEN, log_handler=None)
\ No newline at end of file